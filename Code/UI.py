@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import sys
+from bisect import bisect_right
+from contextlib import contextmanager
 from domain import Transaction, BudgetPeriod
 from service import BudgetService
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import date
-from typing import Optional, List, Callable
+from typing import Optional, List, Callable, Dict, Iterable, Set, Tuple
 
 
 from PyQt6.QtCore import (
@@ -13,7 +15,11 @@ from PyQt6.QtCore import (
     QSize,
     QAbstractTableModel,
     QModelIndex,
+    QDate,
     QSortFilterProxyModel,
+    QTimer,
+    QSignalBlocker,
+    pyqtSignal,
 )
 from PyQt6.QtWidgets import (
     QApplication,
@@ -40,9 +46,110 @@ from PyQt6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
     QAbstractItemView,
+    QHeaderView,
+    QMessageBox,
 )
 
 
+TABLE_ROW_HEIGHT = 24
+# Filter edits within this window are applied together
+FILTER_DEBOUNCE_MS = 120
+# Backend writes within this window are saved to disk together
+SAVE_DEBOUNCE_MS = 500
+
+
+def _use_fixed_row_heights(table: QTableView):
+    """Give every row the same fixed height so Qt never measures rows while painting/scrolling."""
+    header = table.verticalHeader()
+    header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    header.setDefaultSectionSize(TABLE_ROW_HEIGHT)
+    table.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+    table.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+
+
+def _debounce_timer(parent: QWidget, slot: Callable[[], None]) -> QTimer:
+    """Single-shot timer calling `slot`; every start() pushes the call back by FILTER_DEBOUNCE_MS."""
+    timer = QTimer(parent)
+    timer.setSingleShot(True)
+    timer.setInterval(FILTER_DEBOUNCE_MS)
+    timer.timeout.connect(slot)
+    return timer
+
+
+# ---------------------------------------------------------------------------
+# Interned status/type values. Models intern the fields of every transaction
+# they receive, so hot loops can compare with `is` instead of `==`.
+# ---------------------------------------------------------------------------
+
+_STATUS_PENDING = sys.intern("pending")
+_STATUS_CERTAIN = sys.intern("certain")
+_TYPE_INC = sys.intern("income")
+_TYPE_OUT = sys.intern("outgoing")
+
+
+def _intern_transactions(transactions: List[Transaction]):
+    for tx in transactions:
+        tx.status = sys.intern(tx.status)
+        tx.type = sys.intern(tx.type)
+
+
+# Summary bucket of a transaction, cached per row by TransactionTableModel
+_KIND_INC_CERTAIN = 0
+_KIND_OUT_CERTAIN = 1
+_KIND_INC_PENDING = 2
+_KIND_OUT_PENDING = 3
+_KIND_OTHER = 4  # unknown type, not part of any total
+
+
+def _summary_kind(tx: Transaction) -> int:
+    if tx.type is _TYPE_INC:
+        kind = _KIND_INC_CERTAIN
+    elif tx.type is _TYPE_OUT:
+        kind = _KIND_OUT_CERTAIN
+    else:
+        return _KIND_OTHER
+    return kind if tx.status is _STATUS_CERTAIN else kind + 2
+
+
+def _to_cents(amount: float) -> int:
+    """Money is summed as integer cents so totals are exact; divide by 100 only to display."""
+    return round(amount * 100)
+
+
+def _format_totals(inc: int, out: int, pending_count: int) -> Tuple[str, str, str, int]:
+    """Display strings for a (income cents, outgoing cents, pending count) totals entry."""
+    return f"{inc / 100:.2f}", f"{out / 100:.2f}", f"{(inc - out) / 100:.2f}", pending_count
+
+
+_ZERO_TOTALS = _format_totals(0, 0, 0)
+
+
+def _period_totals(transactions: List[Transaction]) -> Dict[int, Tuple[int, int, int]]:
+    """
+    Compute (income cents, outgoing cents, pending count) for every period in
+    a single pass. Income/outgoing only count certain transactions.
+    """
+    pending, certain, inc_type, out_type = _STATUS_PENDING, _STATUS_CERTAIN, _TYPE_INC, _TYPE_OUT
+    inc: Dict[int, int] = {}
+    out: Dict[int, int] = {}
+    pending_count: Dict[int, int] = {}
+    for tx in transactions:
+        pid = tx.linked_period_id
+        if pid is None:
+            continue
+        status = tx.status
+        if status is certain:
+            if tx.type is inc_type:
+                inc[pid] = inc.get(pid, 0) + round(tx.amount * 100)
+            elif tx.type is out_type:
+                out[pid] = out.get(pid, 0) + round(tx.amount * 100)
+        elif status is pending:
+            pending_count[pid] = pending_count.get(pid, 0) + 1
+
+    pids = inc.keys() | out.keys() | pending_count.keys()
+    return {pid: (inc.get(pid, 0), out.get(pid, 0), pending_count.get(pid, 0)) for pid in pids}
+
+
 # ---------------------------------------------------------------------------
 # Table models (UI models, NO backend logic)
 # ---------------------------------------------------------------------------
@@ -55,6 +162,9 @@ class BudgetPeriodTableModel(QAbstractTableModel):
         set_periods(periods: List[BudgetPeriod])
         set_transactions(transactions: List[Transaction])
 
+    Single-period changes can be applied without a full reset through
+    upsert_period / remove_period.
+
     Columns:
         0 Name
         1 Start
@@ -79,29 +189,134 @@ class BudgetPeriodTableModel(QAbstractTableModel):
         transactions: Optional[List[Transaction]] = None,
     ):
         super().__init__()
-        self._periods: List[BudgetPeriod] = periods or []
+        self._periods: List[BudgetPeriod] = list(periods or [])
+        self._by_id: Dict[int, BudgetPeriod] = {p.id: p for p in self._periods}
         self._transactions: List[Transaction] = transactions or []
+        _intern_transactions(self._transactions)
+        # period id -> (income cents, outgoing cents, pending count), rebuilt with the transactions
+        self._totals_cache: Dict[int, Tuple[int, int, int]] = {}
+        # period id -> (income, outgoing, net) as display strings plus pending count
+        self._totals_display: Dict[int, Tuple[str, str, str, int]] = {}
+        self._set_totals(self._build_totals())
+        # isoformat() of start/end per row, rebuilt with the periods
+        self._start_isos: List[str] = []
+        self._end_isos: List[str] = []
+        self._index_periods()
+        # DisplayRole formatter per column, called as f(row, period, display totals)
+        self._formatters: List[Callable[[int, BudgetPeriod, Tuple[str, str, str, int]], object]] = [
+            lambda r, p, t: p.name,
+            lambda r, p, t: self._start_isos[r],
+            lambda r, p, t: self._end_isos[r],
+            lambda r, p, t: t[0],
+            lambda r, p, t: t[1],
+            lambda r, p, t: t[2],
+            lambda r, p, t: t[3],
+        ]
 
     # --------- backend integration API ---------
 
     def set_periods(self, periods: List[BudgetPeriod]):
-        """Replace the list of periods from backend."""
+        """
+        Replace the list of periods from backend. The model keeps its own
+        copy of the list, so upsert_period/remove_period never touch the
+        backend's list.
+        """
         self.beginResetModel()
-        self._periods = periods
+        self._periods = list(periods)
+        self._by_id = {p.id: p for p in self._periods}
+        self._index_periods()
         self.endResetModel()
 
+    def upsert_period(self, period: BudgetPeriod):
+        """Refresh the row of an existing period (matched by id) or append a new one."""
+        row = self._row_of(period.id)
+        self._by_id[period.id] = period
+        if row is None:
+            row = len(self._periods)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._periods.append(period)
+            self._start_isos.append(period.start_date.isoformat())
+            self._end_isos.append(period.end_date.isoformat())
+            self.endInsertRows()
+            return
+        self._periods[row] = period
+        self._start_isos[row] = period.start_date.isoformat()
+        self._end_isos[row] = period.end_date.isoformat()
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+    def remove_period(self, pid: int):
+        """Remove one period row without resetting the model."""
+        row = self._row_of(pid)
+        if row is None:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._by_id[pid]
+        del self._periods[row]
+        del self._start_isos[row]
+        del self._end_isos[row]
+        self.endRemoveRows()
+
     def set_transactions(self, transactions: List[Transaction]):
         """
         Provide the current list of all transactions from backend so that
         totals per period can be computed.
         """
+        _intern_transactions(transactions)
         self._transactions = transactions
-        self.layoutChanged.emit()
+        totals = self._build_totals()
+        if totals == self._totals_cache:
+            return  # nothing visible changed, skip the repaint
+        self._set_totals(totals)
+        self._emit_rows_changed(self.COL_INC, self.COL_PENDING)
+
+    def _emit_rows_changed(self, first_col: int, last_col: int):
+        """Emit one dataChanged covering every row for the given column range."""
+        if self._periods:
+            self.dataChanged.emit(
+                self.index(0, first_col),
+                self.index(len(self._periods) - 1, last_col),
+                [Qt.ItemDataRole.DisplayRole],
+            )
+
+    def apply_transaction_deltas(self, changes: List[Tuple[Optional[Transaction], Optional[Transaction]]]):
+        """
+        Adjust the cached totals for a batch of (old, new) pairs, one per
+        transaction that was added (old is None), removed (new is None) or
+        edited (old is a copy taken before the edit), and repaint only the
+        affected period rows with a single dataChanged.
+        """
+        touched = set()
+        for old, new in changes:
+            for tx, sign in ((old, -1), (new, 1)):
+                if tx is None or tx.linked_period_id is None:
+                    continue
+                pid = tx.linked_period_id
+                inc, out, pending_count = self._totals_cache.get(pid, (0, 0, 0))
+                status = sys.intern(tx.status)
+                tx_type = sys.intern(tx.type)
+                if status is _STATUS_PENDING:
+                    pending_count += sign
+                elif status is _STATUS_CERTAIN:
+                    if tx_type is _TYPE_INC:
+                        inc += sign * _to_cents(tx.amount)
+                    elif tx_type is _TYPE_OUT:
+                        out += sign * _to_cents(tx.amount)
+                self._totals_cache[pid] = (inc, out, pending_count)
+                touched.add(pid)
+        for pid in touched:
+            self._totals_display[pid] = _format_totals(*self._totals_cache[pid])
+
+        rows = [row for row, period in enumerate(self._periods) if period.id in touched]
+        if rows:
+            self.dataChanged.emit(self.index(rows[0], self.COL_INC), self.index(rows[-1], self.COL_PENDING))
 
     @property
     def periods(self) -> List[BudgetPeriod]:
         return self._periods
 
+    def get_by_id(self, pid: Optional[int]) -> Optional[BudgetPeriod]:
+        return self._by_id.get(pid)
+
     @property
     def transactions(self) -> List[Transaction]:
         return self._transactions
@@ -132,6 +347,10 @@ class BudgetPeriodTableModel(QAbstractTableModel):
         return None
 
     def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        # Qt asks for many roles per cell (font, alignment, tooltip, ...);
+        # reject the ones we don't provide before touching the row data
+        if role != Qt.ItemDataRole.DisplayRole and role != Qt.ItemDataRole.UserRole:
+            return None
         if not index.isValid():
             return None
         row = index.row()
@@ -141,46 +360,39 @@ class BudgetPeriodTableModel(QAbstractTableModel):
         period = self._periods[row]
 
         if role == Qt.ItemDataRole.DisplayRole:
-            if col == self.COL_NAME:
-                return period.name
-            elif col == self.COL_START:
-                return period.start_date.isoformat()
-            elif col == self.COL_END:
-                return period.end_date.isoformat()
-            else:
-                inc, out, pending_count = self._compute_totals(period)
-                if col == self.COL_INC:
-                    return f"{inc:.2f}"
-                elif col == self.COL_OUT:
-                    return f"{out:.2f}"
-                elif col == self.COL_NET:
-                    return f"{(inc - out):.2f}"
-                elif col == self.COL_PENDING:
-                    return pending_count
+            if 0 <= col < len(self._formatters):
+                return self._formatters[col](row, period, self._compute_totals(period))
         elif role == Qt.ItemDataRole.UserRole:
             # Underlying BudgetPeriod object
             return period
         return None
 
+    def _row_of(self, pid: int) -> Optional[int]:
+        for row, period in enumerate(self._periods):
+            if period.id == pid:
+                return row
+        return None
+
     def _compute_totals(self, period: BudgetPeriod):
-        inc = 0.0
-        out = 0.0
-        pending_count = 0
-        for tx in self._transactions:
-            if tx.linked_period_id == period.id:
-                if tx.status == "pending":
-                    pending_count += 1
-                if tx.status != "certain":
-                    continue
-                if tx.type == "income":
-                    inc += tx.amount
-                elif tx.type == "outgoing":
-                    out += tx.amount
-        return inc, out, pending_count
+        return self._totals_display.get(period.id, _ZERO_TOTALS)
+
+    def _set_totals(self, totals: Dict[int, Tuple[int, int, int]]):
+        self._totals_cache = totals
+        self._totals_display = {pid: _format_totals(*t) for pid, t in totals.items()}
+
+    def _build_totals(self) -> Dict[int, Tuple[int, int, int]]:
+        return _period_totals(self._transactions)
+
+    def _index_periods(self):
+        self._start_isos = [p.start_date.isoformat() for p in self._periods]
+        self._end_isos = [p.end_date.isoformat() for p in self._periods]
 
     def refresh(self):
         """Call to force a UI refresh if backend changed period objects in place."""
-        self.layoutChanged.emit()
+        _intern_transactions(self._transactions)
+        self._set_totals(self._build_totals())
+        self._index_periods()
+        self._emit_rows_changed(self.COL_NAME, self.COL_PENDING)
 
 
 class TransactionTableModel(QAbstractTableModel):
@@ -194,6 +406,9 @@ class TransactionTableModel(QAbstractTableModel):
     can show period names for each transaction:
 
         set_period_resolver(lambda pid: BudgetPeriod | None)
+
+    Changes to single transactions can be applied without a full reset
+    through add_transaction / update_transaction / remove_transactions.
     """
 
     COL_STATUS = 0
@@ -204,6 +419,10 @@ class TransactionTableModel(QAbstractTableModel):
     COL_CAT = 5
     COL_PERIOD = 6
 
+    # List of (old, new) pairs, one batch per incremental add/remove/update;
+    # see BudgetPeriodTableModel.apply_transaction_deltas
+    transactions_changed = pyqtSignal(object)
+
     def __init__(
         self,
         transactions: Optional[List[Transaction]] = None,
@@ -212,15 +431,103 @@ class TransactionTableModel(QAbstractTableModel):
         super().__init__()
         self._transactions: List[Transaction] = transactions or []
         self._period_resolver = period_resolver
+        # Per-row caches derived from _transactions, rebuilt in place by _reindex()
+        # so the list objects stay valid for anyone holding on to them
+        self._search_keys: List[str] = []
+        self._ordinals: List[int] = []
+        self._cents: List[int] = []
+        # Display strings, formatted on first paint so rows that are never
+        # shown are never formatted (None = not formatted yet)
+        self._date_isos: List[Optional[str]] = []
+        self._amount_strs: List[Optional[str]] = []
+        self._kinds: List[int] = []
+        self._id_to_row: Dict[int, int] = {}
+        # All search keys joined into one string plus each row's start offset,
+        # built on demand by search_corpus()
+        self._search_corpus: Optional[Tuple[str, List[int]]] = None
+        # period id -> cents summed per _KIND_* bucket
+        self._summary_by_period: Dict[Optional[int], List[int]] = {}
+        self._reindex()
+        # DisplayRole formatter per column, called as f(row, tx)
+        self._formatters: List[Callable[[int, Transaction], object]] = [
+            lambda r, tx: tx.status.capitalize(),
+            lambda r, tx: tx.type.capitalize(),
+            lambda r, tx: self._date_isos[r] or self._format_date(r),
+            lambda r, tx: tx.description,
+            lambda r, tx: self._amount_strs[r] or self._format_amount(r),
+            lambda r, tx: tx.category,
+            lambda r, tx: self._period_name(tx),
+        ]
 
     # --------- backend integration API ---------
 
     def set_transactions(self, transactions: List[Transaction]):
-        """Replace the list of transactions from backend."""
+        """
+        Replace the list of transactions from backend. The model keeps its
+        own copy of the list, so the incremental methods below never touch
+        the backend's list.
+        """
         self.beginResetModel()
-        self._transactions = transactions
+        self._transactions = list(transactions)
+        self._reindex()
         self.endResetModel()
 
+    def add_transaction(self, tx: Transaction):
+        """Append one new transaction without resetting the model."""
+        row = len(self._transactions)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._transactions.append(tx)
+        for cache in self._row_caches():
+            cache.append(None)
+        self._index_row(row)
+        self._id_to_row[tx.id] = row
+        self._add_to_summary(row, tx.linked_period_id, 1)
+        self.endInsertRows()
+        self.transactions_changed.emit([(None, tx)])
+
+    def remove_transactions(self, ids: Iterable[int]):
+        """
+        Remove the transactions with the given ids, one beginRemoveRows per
+        run of adjacent rows, without resetting the model.
+        """
+        rows = sorted({self._id_to_row[i] for i in ids if i in self._id_to_row}, reverse=True)
+        if not rows:
+            return
+        removed: List[Transaction] = []
+        i = 0
+        while i < len(rows):
+            # Walk up to the first row of this run; going bottom-up keeps
+            # the rows of the remaining runs valid
+            last = first = rows[i]
+            while i + 1 < len(rows) and rows[i + 1] == first - 1:
+                i += 1
+                first = rows[i]
+            self.beginRemoveRows(QModelIndex(), first, last)
+            removed.extend(self._transactions[first:last + 1])
+            del self._transactions[first:last + 1]
+            for cache in self._row_caches():
+                del cache[first:last + 1]
+            self.endRemoveRows()
+            i += 1
+        self._reindex()
+        self.transactions_changed.emit([(tx, None) for tx in removed])
+
+    def update_transaction(self, old: Transaction, new: Transaction):
+        """
+        Refresh the row of a transaction the backend edited. `old` is a copy
+        taken before the edit, used to move the row between period summaries
+        and to adjust totals listening on transactions_changed.
+        """
+        row = self._row_of(new.id)
+        if row is None:
+            return
+        self._add_to_summary(row, old.linked_period_id, -1)
+        self._transactions[row] = new
+        self._index_row(row)
+        self._add_to_summary(row, new.linked_period_id, 1)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+        self.transactions_changed.emit([(old, new)])
+
     def set_period_resolver(
         self,
         resolver: Optional[Callable[[Optional[int]], Optional[BudgetPeriod]]],
@@ -230,12 +537,93 @@ class TransactionTableModel(QAbstractTableModel):
         (or None). E.g. backend can pass a lookup function.
         """
         self._period_resolver = resolver
-        self.layoutChanged.emit()
+        self.refresh_period_names()
+
+    def refresh_period_names(self):
+        """Repaint the period column, e.g. after a period was renamed or deleted."""
+        self._emit_rows_changed(self.COL_PERIOD, self.COL_PERIOD)
 
     @property
     def transactions(self) -> List[Transaction]:
         return self._transactions
 
+    @property
+    def search_keys(self) -> List[str]:
+        """Case-folded "description category" text per row, for searching."""
+        return self._search_keys
+
+    def search_corpus(self) -> Tuple[str, List[int]]:
+        """
+        The search keys joined by NUL (which can't occur in a search) and the
+        offset each row starts at, so a search can scan all rows with str.find.
+        """
+        if self._search_corpus is None:
+            starts = []
+            offset = 0
+            for key in self._search_keys:
+                starts.append(offset)
+                offset += len(key) + 1
+            self._search_corpus = ("\0".join(self._search_keys), starts)
+        return self._search_corpus
+
+    @property
+    def ordinals(self) -> List[int]:
+        """tx.date.toordinal() per row, for integer date comparisons."""
+        return self._ordinals
+
+    @property
+    def cents(self) -> List[int]:
+        """tx.amount in integer cents per row, for exact totals."""
+        return self._cents
+
+    def summary_for_period(self, pid: Optional[int]) -> Tuple[int, int, int, int]:
+        """(income certain, outgoing certain, income pending, outgoing pending) cents of period `pid`."""
+        sums = self._summary_by_period.get(pid)
+        return (sums[0], sums[1], sums[2], sums[3]) if sums else (0, 0, 0, 0)
+
+    def _row_of(self, tx_id: int) -> Optional[int]:
+        return self._id_to_row.get(tx_id)
+
+    def _row_caches(self) -> Tuple[list, ...]:
+        """The per-row cache lists, all parallel to _transactions."""
+        return (self._search_keys, self._ordinals, self._cents, self._date_isos, self._amount_strs, self._kinds)
+
+    def _index_row(self, row: int):
+        """Refresh the per-row caches of a single row."""
+        tx = self._transactions[row]
+        tx.status = sys.intern(tx.status)
+        tx.type = sys.intern(tx.type)
+        self._search_keys[row] = f"{tx.description} {tx.category}".casefold()
+        self._search_corpus = None
+        self._ordinals[row] = tx.date.toordinal()
+        self._cents[row] = _to_cents(tx.amount)
+        self._date_isos[row] = None
+        self._amount_strs[row] = None
+        self._kinds[row] = _summary_kind(tx)
+
+    def _reindex(self):
+        _intern_transactions(self._transactions)
+        self._search_keys[:] = [f"{tx.description} {tx.category}".casefold() for tx in self._transactions]
+        self._search_corpus = None
+        self._ordinals[:] = [tx.date.toordinal() for tx in self._transactions]
+        self._cents[:] = [_to_cents(tx.amount) for tx in self._transactions]
+        self._date_isos[:] = [None] * len(self._transactions)
+        self._amount_strs[:] = [None] * len(self._transactions)
+        self._kinds[:] = [_summary_kind(tx) for tx in self._transactions]
+        self._id_to_row = {tx.id: row for row, tx in enumerate(self._transactions)}
+        summary_by_period: Dict[Optional[int], List[int]] = {}
+        for tx, kind, cents in zip(self._transactions, self._kinds, self._cents):
+            sums = summary_by_period.get(tx.linked_period_id)
+            if sums is None:
+                sums = summary_by_period[tx.linked_period_id] = [0, 0, 0, 0, 0]
+            sums[kind] += cents
+        self._summary_by_period = summary_by_period
+
+    def _add_to_summary(self, row: int, pid: Optional[int], sign: int):
+        """Add (sign=1) or take out (sign=-1) the cached values of `row` from period `pid`'s summary."""
+        sums = self._summary_by_period.setdefault(pid, [0, 0, 0, 0, 0])
+        sums[self._kinds[row]] += sign * self._cents[row]
+
     # --------- model implementation ---------
 
     def rowCount(self, parent=QModelIndex()) -> int:
@@ -262,6 +650,10 @@ class TransactionTableModel(QAbstractTableModel):
         return None
 
     def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        # Qt asks for many roles per cell (font, alignment, tooltip, ...);
+        # reject the ones we don't provide before touching the row data
+        if role != Qt.ItemDataRole.DisplayRole and role != Qt.ItemDataRole.UserRole:
+            return None
         if not index.isValid():
             return None
         row = index.row()
@@ -271,31 +663,39 @@ class TransactionTableModel(QAbstractTableModel):
         tx = self._transactions[row]
 
         if role == Qt.ItemDataRole.DisplayRole:
-            if col == self.COL_STATUS:
-                return tx.status.capitalize()
-            elif col == self.COL_TYPE:
-                return tx.type.capitalize()
-            elif col == self.COL_DATE:
-                return tx.date.isoformat()
-            elif col == self.COL_DESC:
-                return tx.description
-            elif col == self.COL_AMOUNT:
-                return f"{tx.amount:.2f}"
-            elif col == self.COL_CAT:
-                return tx.category
-            elif col == self.COL_PERIOD:
-                if tx.linked_period_id is None or self._period_resolver is None:
-                    return "—"
-                period = self._period_resolver(tx.linked_period_id)
-                return period.name if period else "—"
+            if 0 <= col < len(self._formatters):
+                return self._formatters[col](row, tx)
         elif role == Qt.ItemDataRole.UserRole:
             # Underlying Transaction object
             return tx
         return None
 
+    def _format_date(self, row: int) -> str:
+        text = self._date_isos[row] = self._transactions[row].date.isoformat()
+        return text
+
+    def _format_amount(self, row: int) -> str:
+        text = self._amount_strs[row] = f"{self._transactions[row].amount:.2f}"
+        return text
+
+    def _period_name(self, tx: Transaction) -> str:
+        if tx.linked_period_id is None or self._period_resolver is None:
+            return "—"
+        period = self._period_resolver(tx.linked_period_id)
+        return period.name if period else "—"
+
     def refresh(self):
         """Call to force a UI refresh if backend changed transaction objects in place."""
-        self.layoutChanged.emit()
+        self._reindex()
+        self._emit_rows_changed(self.COL_STATUS, self.COL_PERIOD)
+
+    def _emit_rows_changed(self, first_col: int, last_col: int):
+        """Emit one dataChanged covering every row for the given column range."""
+        if self._transactions:
+            self.dataChanged.emit(
+                self.index(0, first_col),
+                self.index(len(self._transactions) - 1, last_col),
+            )
 
 
 # ---------------------------------------------------------------------------
@@ -313,6 +713,13 @@ class BudgetPeriodFilterProxyModel(QSortFilterProxyModel):
         super().__init__()
         self._name_filter = ""
         self._active_only = False
+        # Reference date for the 'active' check, refreshed once per filter pass
+        self._today = date.today()
+        self._source: Optional[BudgetPeriodTableModel] = None
+
+    def setSourceModel(self, model: BudgetPeriodTableModel):
+        self._source = model
+        super().setSourceModel(model)
 
     def set_name_filter(self, text: str):
         self._name_filter = text.lower()
@@ -322,19 +729,20 @@ class BudgetPeriodFilterProxyModel(QSortFilterProxyModel):
         self._active_only = active_only
         self.invalidateFilter()
 
+    def invalidateFilter(self):
+        self._today = date.today()
+        super().invalidateFilter()
+
     def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
-        model: BudgetPeriodTableModel = self.sourceModel()  # type: ignore
-        idx = model.index(source_row, 0, source_parent)
-        period: BudgetPeriod = model.data(idx, Qt.ItemDataRole.UserRole)
-        if period is None:
-            return False
+        # Read the source list directly instead of going through index()/data()
+        period = self._source.periods[source_row]
 
         if self._name_filter:
             if self._name_filter not in period.name.lower():
                 return False
 
         if self._active_only:
-            today = date.today()
+            today = self._today
             if not (period.start_date <= today <= period.end_date):
                 return False
 
@@ -354,100 +762,226 @@ class TransactionsFilterProxyModel(QSortFilterProxyModel):
         self.attachment_filter = "all"    # 'all', 'attached', 'unattached'
         self.date_from: Optional[date] = None
         self.date_to: Optional[date] = None
+        self._ord_from: Optional[int] = None
+        self._ord_to: Optional[int] = None
         self.search_text: str = ""
         self.linked_period_id: Optional[int] = None  # when used for attached list
+        # Source rows matching search_text, narrowed while the user keeps typing.
+        # None when there is no search or the source rows changed since.
+        self._search_hits: Optional[Set[int]] = None
+        # Result of visible_totals(), None when filters or source rows changed since
+        self._visible_totals: Optional[Tuple[int, float, float]] = None
+        # Set inside batch_filter_changes(): re-filter once when the batch ends
+        self._batching = False
+        self._batch_pending = False
+        # Only the predicates of the filters currently enabled, rebuilt on every change
+        self._active_checks: Tuple[Callable[[Transaction, int], bool], ...] = ()
+        self._source: Optional[TransactionTableModel] = None
+
+    def setSourceModel(self, model: TransactionTableModel):
+        if self._source is not None:
+            for signal in self._source_change_signals(self._source):
+                signal.disconnect(self._source_rows_changed)
+        self._source = model
+        self._search_hits = None
+        self._visible_totals = None
+        self._active_checks = self._build_checks()
+        # Connected before the base class hooks up its own slots, so a stale
+        # hit set is dropped before the proxy re-filters the changed rows
+        # (and cached totals before anyone reacts to the change)
+        for signal in self._source_change_signals(model):
+            signal.connect(self._source_rows_changed)
+        super().setSourceModel(model)
+
+    @staticmethod
+    def _source_change_signals(model: TransactionTableModel):
+        return (model.modelReset, model.rowsInserted, model.rowsRemoved, model.dataChanged)
+
+    def _source_rows_changed(self, *args):
+        self._visible_totals = None
+        if self._search_hits is not None:
+            self._search_hits = None
+            self._active_checks = self._build_checks()
 
     # --------- filter configuration ---------
 
+    # Setters that don't change anything return without re-filtering, so
+    # pages can push their whole filter state on every edit.
+
+    @contextmanager
+    def batch_filter_changes(self):
+        """Apply several set_* calls with a single re-filter at the end."""
+        self._batching = True
+        try:
+            yield
+        finally:
+            self._batching = False
+            if self._batch_pending:
+                self._batch_pending = False
+                self._filters_changed()
+
     def set_type_filter(self, value: str):
-        self.type_filter = value
-        self.invalidateFilter()
+        if value == self.type_filter:
+            return
+        self.type_filter = sys.intern(value)
+        self._filters_changed()
 
     def set_status_filter(self, value: str):
-        self.status_filter = value
-        self.invalidateFilter()
+        if value == self.status_filter:
+            return
+        self.status_filter = sys.intern(value)
+        self._filters_changed()
 
     def set_attachment_filter(self, value: str):
+        if value == self.attachment_filter:
+            return
         self.attachment_filter = value
-        self.invalidateFilter()
+        self._filters_changed()
 
     def set_date_from(self, d: Optional[date]):
+        if d == self.date_from:
+            return
         self.date_from = d
-        self.invalidateFilter()
+        self._ord_from = d.toordinal() if d is not None else None
+        self._filters_changed()
 
     def set_date_to(self, d: Optional[date]):
+        if d == self.date_to:
+            return
         self.date_to = d
-        self.invalidateFilter()
+        self._ord_to = d.toordinal() if d is not None else None
+        self._filters_changed()
 
     def set_search_text(self, text: str):
-        self.search_text = text.lower()
-        self.invalidateFilter()
+        needle = text.casefold()
+        if needle == self.search_text and (not needle or self._search_hits is not None):
+            return
+        previous, previous_hits = self.search_text, self._search_hits
+        self.search_text = needle
+        if not needle or self._source is None:
+            self._search_hits = None
+        elif previous and previous_hits is not None and needle.startswith(previous):
+            # Typing one more character can only narrow the previous matches
+            keys = self._source.search_keys
+            self._search_hits = {row for row in previous_hits if needle in keys[row]}
+        else:
+            self._search_hits = self._scan_search_corpus(needle)
+        self._filters_changed()
+
+    def _scan_search_corpus(self, needle: str) -> Set[int]:
+        """Rows whose search key contains `needle`, found with str.find over the joined keys."""
+        text, starts = self._source.search_corpus()
+        hits: Set[int] = set()
+        row_count = len(starts)
+        pos = text.find(needle)
+        while pos != -1:
+            row = bisect_right(starts, pos) - 1
+            hits.add(row)
+            if row + 1 >= row_count:
+                break
+            pos = text.find(needle, starts[row + 1])
+        return hits
 
     def set_linked_period_id(self, pid: Optional[int]):
+        if pid == self.linked_period_id:
+            return
         self.linked_period_id = pid
-        self.invalidateFilter()
+        self._filters_changed()
 
     # --------- filter logic ---------
 
-    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
-        model: TransactionTableModel = self.sourceModel()  # type: ignore
-        idx = model.index(source_row, 0, source_parent)
-        tx: Transaction = model.data(idx, Qt.ItemDataRole.UserRole)
-        if tx is None:
-            return False
-
-        if self.type_filter in ("income", "outgoing") and tx.type != self.type_filter:
-            return False
-
-        if self.status_filter in ("pending", "certain") and tx.status != self.status_filter:
-            return False
-
-        if self.attachment_filter == "attached" and tx.linked_period_id is None:
-            return False
-        if self.attachment_filter == "unattached" and tx.linked_period_id is not None:
-            return False
+    def _filters_changed(self):
+        if self._batching:
+            self._batch_pending = True
+            return
+        self._active_checks = self._build_checks()
+        self._visible_totals = None
+        self.invalidateFilter()
 
-        if self.linked_period_id is not None and tx.linked_period_id != self.linked_period_id:
-            return False
+    def _build_checks(self) -> Tuple[Callable[[Transaction, int], bool], ...]:
+        """
+        Specialize the current filter configuration into a tuple of small
+        predicates taking (transaction, source row), skipping every filter
+        that is set to 'all'/empty.
+        """
+        source = self._source
+        if source is None:
+            return ()
+        checks: List[Callable[[Transaction, int], bool]] = []
+
+        # Most selective first: an attached-list proxy rejects every other
+        # period's rows after a single compare
+        linked_period_id = self.linked_period_id
+        if linked_period_id is not None:
+            checks.append(lambda tx, row: tx.linked_period_id == linked_period_id)
+
+        type_filter = self.type_filter
+        if type_filter in (_TYPE_INC, _TYPE_OUT):
+            checks.append(lambda tx, row: tx.type is type_filter)
+
+        status_filter = self.status_filter
+        if status_filter in (_STATUS_PENDING, _STATUS_CERTAIN):
+            checks.append(lambda tx, row: tx.status is status_filter)
+
+        if self.attachment_filter == "attached":
+            checks.append(lambda tx, row: tx.linked_period_id is not None)
+        elif self.attachment_filter == "unattached":
+            checks.append(lambda tx, row: tx.linked_period_id is None)
+
+        # Both date bounds in one integer range check on the cached ordinals
+        if self._ord_from is not None or self._ord_to is not None:
+            lo = self._ord_from if self._ord_from is not None else date.min.toordinal()
+            hi = self._ord_to if self._ord_to is not None else date.max.toordinal()
+            ordinals = source.ordinals
+            checks.append(lambda tx, row: lo <= ordinals[row] <= hi)
+
+        needle = self.search_text
+        if needle:
+            hits = self._search_hits
+            if hits is not None:
+                checks.append(lambda tx, row: row in hits)
+            else:
+                search_keys = source.search_keys
+                checks.append(lambda tx, row: needle in search_keys[row])
 
-        if self.date_from is not None and tx.date < self.date_from:
-            return False
-        if self.date_to is not None and tx.date > self.date_to:
-            return False
+        return tuple(checks)
 
-        if self.search_text:
-            text = f"{tx.description} {tx.category}".lower()
-            if self.search_text not in text:
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        # Read the source list directly instead of going through index()/data()
+        tx = self._source.transactions[source_row]
+        for check in self._active_checks:
+            if not check(tx, source_row):
                 return False
-
         return True
 
     def visible_totals(self):
         """
         Compute totals (certain only) for currently visible rows.
 
-        Returns (count, income_total, outgoing_total)
+        Returns (count, income_total, outgoing_total). The result is cached
+        until the filters or the source rows change.
         """
+        if self._visible_totals is not None:
+            return self._visible_totals
         count = 0
-        inc = 0.0
-        out = 0.0
-        model: TransactionTableModel = self.sourceModel()  # type: ignore
+        inc = 0
+        out = 0
+        # Map each visible row to its source row and read the source list
+        # directly, skipping the proxy's data() round-trip
+        src = self._source.transactions
+        cents = self._source.cents
         for row in range(self.rowCount()):
-            idx = self.index(row, 0)
-            tx: Transaction = self.data(idx, Qt.ItemDataRole.UserRole)
-            if tx is None:
-                continue
+            source_row = self.mapToSource(self.index(row, 0)).row()
+            tx = src[source_row]
             count += 1
-            if tx.status != "certain":
+            if tx.status is not _STATUS_CERTAIN:
                 continue
-            if tx.type == "income":
-                inc += tx.amount
-            elif tx.type == "outgoing":
-                out += tx.amount
-        return count, inc, out
-
-    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
-        return super().data(index, role)
+            if tx.type is _TYPE_INC:
+                inc += cents[source_row]
+            elif tx.type is _TYPE_OUT:
+                out += cents[source_row]
+        self._visible_totals = (count, inc / 100, out / 100)
+        return self._visible_totals
 
 
 # ---------------------------------------------------------------------------
@@ -473,8 +1007,6 @@ class PeriodDialog(QDialog):
         self.setMinimumWidth(400)
         self._period = period
 
-        from PyQt6.QtCore import QDate
-
         main_layout = QVBoxLayout(self)
         form_layout = QGridLayout()
 
@@ -519,16 +1051,12 @@ class PeriodDialog(QDialog):
             self._load_from_period(period)
 
     def _load_from_period(self, period: BudgetPeriod):
-        from PyQt6.QtCore import QDate
-
         self.name_edit.setText(period.name)
         self.notes_edit.setPlainText(period.notes)
         self.start_date_edit.setDate(QDate(period.start_date.year, period.start_date.month, period.start_date.day))
         self.end_date_edit.setDate(QDate(period.end_date.year, period.end_date.month, period.end_date.day))
 
     def get_period_data(self) -> dict:
-        from PyQt6.QtCore import QDate
-
         sd_q: QDate = self.start_date_edit.date()
         ed_q: QDate = self.end_date_edit.date()
         sd = date(sd_q.year(), sd_q.month(), sd_q.day())
@@ -575,8 +1103,6 @@ class TransactionDialog(QDialog):
         self._periods = periods or []
         self._categories = categories or []
 
-        from PyQt6.QtCore import QDate
-
         main_layout = QVBoxLayout(self)
         form_layout = QGridLayout()
 
@@ -602,9 +1128,12 @@ class TransactionDialog(QDialog):
 
         self.period_combo = QComboBox()
         self.period_combo.setEditable(False)
+        # Nothing listens yet; don't emit currentIndexChanged per item
+        self.period_combo.blockSignals(True)
         self.period_combo.addItem("Auto (let backend choose)", userData=None)
         for p in self._periods:
             self.period_combo.addItem(p.name, userData=p.id)
+        self.period_combo.blockSignals(False)
 
         row = 0
         form_layout.addWidget(QLabel("Type:"), row, 0)
@@ -651,8 +1180,6 @@ class TransactionDialog(QDialog):
             self._load_from_transaction(tx)
 
     def _load_from_transaction(self, tx: Transaction):
-        from PyQt6.QtCore import QDate
-
         self.type_combo.setCurrentText(tx.type.capitalize())
         self.status_combo.setCurrentText(tx.status.capitalize())
         self.description_edit.setText(tx.description)
@@ -668,8 +1195,6 @@ class TransactionDialog(QDialog):
             self.period_combo.setCurrentIndex(0)
 
     def get_transaction_data(self) -> dict:
-        from PyQt6.QtCore import QDate
-
         qd: QDate = self.date_edit.date()
         d = date(qd.year(), qd.month(), qd.day())
         linked_data = self.period_combo.currentData()
@@ -698,6 +1223,8 @@ class BudgetPeriodsPage(QWidget):
       - React to dialog results in the  BACKEND sections.
     """
 
+    changes_applied = pyqtSignal()
+
     def __init__(
         self,
         periods_model: BudgetPeriodTableModel,
@@ -733,6 +1260,7 @@ class BudgetPeriodsPage(QWidget):
         self.periods_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.periods_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.periods_table.setAlternatingRowColors(True)
+        _use_fixed_row_heights(self.periods_table)
         self.periods_table.setModel(self.periods_proxy)
         left_layout.addWidget(self.periods_table)
 
@@ -829,6 +1357,7 @@ class BudgetPeriodsPage(QWidget):
         self.income_table = QTableView()
         self.income_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.income_table.setAlternatingRowColors(True)
+        _use_fixed_row_heights(self.income_table)
         income_layout.addWidget(self.income_table)
         self.transactions_tabs.addTab(income_tab, "Incomes")
 
@@ -845,19 +1374,21 @@ class BudgetPeriodsPage(QWidget):
         self.outgoing_table = QTableView()
         self.outgoing_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.outgoing_table.setAlternatingRowColors(True)
+        _use_fixed_row_heights(self.outgoing_table)
         outgoing_layout.addWidget(self.outgoing_table)
         self.transactions_tabs.addTab(outgoing_tab, "Outgoings")
 
         detail_layout.addWidget(self.transactions_tabs)
 
         # Proxies for attached transactions
+        # Fixed filters go in before the source, so the first mapping is the only one
         self.income_proxy = TransactionsFilterProxyModel()
-        self.income_proxy.setSourceModel(self.transactions_model)
         self.income_proxy.set_type_filter("income")
+        self.income_proxy.setSourceModel(self.transactions_model)
 
         self.outgoing_proxy = TransactionsFilterProxyModel()
-        self.outgoing_proxy.setSourceModel(self.transactions_model)
         self.outgoing_proxy.set_type_filter("outgoing")
+        self.outgoing_proxy.setSourceModel(self.transactions_model)
 
         self.income_table.setModel(self.income_proxy)
         self.outgoing_table.setModel(self.outgoing_proxy)
@@ -866,6 +1397,7 @@ class BudgetPeriodsPage(QWidget):
         main_layout.addWidget(self.detail_widget, stretch=2)
 
         # Connections
+        self._period_filter_timer = _debounce_timer(self, self._apply_period_filters)
         self.search_edit.textChanged.connect(self.on_period_filter_changed)
         self.active_only_combo.currentIndexChanged.connect(self.on_period_filter_changed)
         self.new_period_btn.clicked.connect(self.on_new_period_clicked)
@@ -875,19 +1407,23 @@ class BudgetPeriodsPage(QWidget):
         self.recalc_links_btn.clicked.connect(self.on_recalc_links_clicked)
         self.include_pending_checkbox.toggled.connect(self.on_include_pending_toggled)
 
+        # (period id, include pending) the summary labels show, None = must redraw
+        self._summary_shown: Optional[Tuple[Optional[int], bool]] = None
+        for signal in (
+            self.transactions_model.modelReset,
+            self.transactions_model.rowsInserted,
+            self.transactions_model.rowsRemoved,
+            self.transactions_model.dataChanged,
+        ):
+            signal.connect(self._mark_summary_dirty)
+
         self.income_status_filter.currentIndexChanged.connect(
             self.on_attached_income_filter_changed
         )
         self.outgoing_status_filter.currentIndexChanged.connect(
             self.on_attached_outgoing_filter_changed
         )
-
-        # Initial load for this page from backend
-        periods = self.service.get_periods()
-        txs = self.service.get_transactions()
-        self.periods_model.set_periods(periods)
-        self.periods_model.set_transactions(txs)
-        self.transactions_model.set_transactions(txs)
+        # The shared models are filled once, by MainWindow.refresh_from_backend()
 
     # --------- helpers ---------
 
@@ -901,30 +1437,43 @@ class BudgetPeriodsPage(QWidget):
         return period
 
     def _update_detail_for_period(self, period: Optional[BudgetPeriod]):
-        from PyQt6.QtCore import QDate
+        # Filling the detail widgets is not a user edit, keep their signals quiet
+        with QSignalBlocker(self.period_name_edit), QSignalBlocker(self.period_notes_edit), \
+                QSignalBlocker(self.period_start_date), QSignalBlocker(self.period_end_date):
+            if period is None:
+                self.period_name_edit.setText("")
+                self.period_notes_edit.setPlainText("")
+                today = QDate.currentDate()
+                self.period_start_date.setDate(today)
+                self.period_end_date.setDate(today)
+            else:
+                self.period_name_edit.setText(period.name)
+                self.period_notes_edit.setPlainText(period.notes)
+                self.period_start_date.setDate(QDate(period.start_date.year, period.start_date.month, period.start_date.day))
+                self.period_end_date.setDate(QDate(period.end_date.year, period.end_date.month, period.end_date.day))
 
         if period is None:
-            self.period_name_edit.setText("")
-            self.period_notes_edit.setPlainText("")
-            today = QDate.currentDate()
-            self.period_start_date.setDate(today)
-            self.period_end_date.setDate(today)
             self.income_proxy.set_linked_period_id(None)
             self.outgoing_proxy.set_linked_period_id(None)
             self._update_summary_labels(None)
             return
 
-        self.period_name_edit.setText(period.name)
-        self.period_notes_edit.setPlainText(period.notes)
-        self.period_start_date.setDate(QDate(period.start_date.year, period.start_date.month, period.start_date.day))
-        self.period_end_date.setDate(QDate(period.end_date.year, period.end_date.month, period.end_date.day))
-
         self.income_proxy.set_linked_period_id(period.id)
         self.outgoing_proxy.set_linked_period_id(period.id)
 
         self._update_summary_labels(period)
 
+    def _mark_summary_dirty(self, *args):
+        self._summary_shown = None
+
     def _update_summary_labels(self, period: Optional[BudgetPeriod]):
+        # Selection signals fire repeatedly, e.g. after the proxy re-maps;
+        # skip the labels when neither the inputs nor the transactions changed
+        shown = (period.id if period is not None else None, self.include_pending_checkbox.isChecked())
+        if shown == self._summary_shown:
+            return
+        self._summary_shown = shown
+
         if period is None:
             self.total_income_label.setText("Total income (certain): 0")
             self.total_outgoing_label.setText("Total outgoing (certain): 0")
@@ -933,29 +1482,16 @@ class BudgetPeriodsPage(QWidget):
             self.pending_outgoing_label.setText("Pending outgoing: 0")
             return
 
-        inc_certain = 0.0
-        out_certain = 0.0
-        inc_pending = 0.0
-        out_pending = 0.0
-
         include_pending = self.include_pending_checkbox.isChecked()
 
-        for tx in self.transactions_model.transactions:
-            if tx.linked_period_id != period.id:
-                continue
-            if tx.type == "income":
-                if tx.status == "certain":
-                    inc_certain += tx.amount
-                else:
-                    inc_pending += tx.amount
-            elif tx.type == "outgoing":
-                if tx.status == "certain":
-                    out_certain += tx.amount
-                else:
-                    out_pending += tx.amount
-
-        total_inc = inc_certain + (inc_pending if include_pending else 0.0)
-        total_out = out_certain + (out_pending if include_pending else 0.0)
+        inc_certain, out_certain, inc_pending, out_pending = (
+            self.transactions_model.summary_for_period(period.id)
+        )
+
+        total_inc = (inc_certain + (inc_pending if include_pending else 0)) / 100
+        total_out = (out_certain + (out_pending if include_pending else 0)) / 100
+        inc_pending /= 100
+        out_pending /= 100
 
         self.total_income_label.setText(
             f"Total income ({'incl. pending' if include_pending else 'certain'}): {total_inc:.2f}"
@@ -967,9 +1503,26 @@ class BudgetPeriodsPage(QWidget):
         self.pending_income_label.setText(f"Pending income: {inc_pending:.2f}")
         self.pending_outgoing_label.setText(f"Pending outgoing: {out_pending:.2f}")
 
+    def _period_updated(self, period: BudgetPeriod):
+        self.periods_model.upsert_period(period)
+        self._transactions_relinked()  # also repaints the renamed period column
+
+    def _transactions_relinked(self):
+        """
+        The backend re-attached transactions to periods in place: rebuild the
+        period totals and refresh the transaction rows without a model reset.
+        """
+        self.transactions_model.refresh()
+        self.periods_model.set_transactions(self.transactions_model.transactions)
+        self._update_detail_for_period(self._get_selected_period())
+        self.changes_applied.emit()
+
     # --------- slots / UI events (no backend side-effects) ---------
 
     def on_period_filter_changed(self):
+        self._period_filter_timer.start()
+
+    def _apply_period_filters(self):
         text = self.search_edit.text()
         self.periods_proxy.set_name_filter(text)
         active_only = self.active_only_combo.currentIndex() == 1
@@ -983,12 +1536,9 @@ class BudgetPeriodsPage(QWidget):
         dialog = PeriodDialog(self)
         if dialog.exec():
             data = dialog.get_period_data()
-            self.service.create_period(data)
-            periods = self.service.get_periods()
-            txs = self.service.get_transactions()
-            self.periods_model.set_periods(periods)
-            self.periods_model.set_transactions(txs)
-            self.transactions_model.set_transactions(txs)
+            period = self.service.create_period(data)
+            self.periods_model.upsert_period(period)
+            self._transactions_relinked()
 
     def on_edit_period_clicked(self):
         period = self._get_selected_period()
@@ -997,27 +1547,20 @@ class BudgetPeriodsPage(QWidget):
         dialog = PeriodDialog(self, period=period)
         if dialog.exec():
             data = dialog.get_period_data()
-            self.service.update_period(data, period)
-            periods = self.service.get_periods()
-            txs = self.service.get_transactions()
-            self.periods_model.set_periods(periods)
-            self.periods_model.set_transactions(txs)
-            self.transactions_model.set_transactions(txs)
+            self._period_updated(self.service.update_period(data, period))
 
     def on_delete_period_clicked(self):
         period = self._get_selected_period()
         if period is None:
             return
-        self.service.delete_period(period)
-        periods = self.service.get_periods()
-        txs = self.service.get_transactions()
-        self.periods_model.set_periods(periods)
-        self.periods_model.set_transactions(txs)
-        self.transactions_model.set_transactions(txs)
+        pid = self.service.delete_period(period)
+        self.periods_model.remove_period(pid)
+        # linked transactions stay linked to the removed id, only their period name changes
+        self.transactions_model.refresh_period_names()
+        self._update_detail_for_period(self._get_selected_period())
+        self.changes_applied.emit()
 
     def on_save_period_clicked(self):
-        from PyQt6.QtCore import QDate
-
         period = self._get_selected_period()
         if period is None:
             return
@@ -1031,20 +1574,11 @@ class BudgetPeriodsPage(QWidget):
             "notes": self.period_notes_edit.toPlainText(),
         }
 
-        self.service.update_period(data, period)
-        periods = self.service.get_periods()
-        txs = self.service.get_transactions()
-        self.periods_model.set_periods(periods)
-        self.periods_model.set_transactions(txs)
-        self.transactions_model.set_transactions(txs)
+        self._period_updated(self.service.update_period(data, period))
 
     def on_recalc_links_clicked(self):
         self.service.recalculate_attachments()
-        periods = self.service.get_periods()
-        txs = self.service.get_transactions()
-        self.periods_model.set_periods(periods)
-        self.periods_model.set_transactions(txs)
-        self.transactions_model.set_transactions(txs)
+        self._transactions_relinked()
 
     def on_include_pending_toggled(self, checked: bool):
         self._update_summary_labels(self._get_selected_period())
@@ -1065,6 +1599,8 @@ class BudgetPeriodsPage(QWidget):
 class TransactionsPage(QWidget):
     """Global view of all transactions with filters."""
 
+    changes_applied = pyqtSignal()
+
     def __init__(
         self,
         transactions_model: TransactionTableModel,
@@ -1119,6 +1655,7 @@ class TransactionsPage(QWidget):
         self.transactions_table = QTableView()
         self.transactions_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.transactions_table.setAlternatingRowColors(True)
+        _use_fixed_row_heights(self.transactions_table)
 
         self.proxy = TransactionsFilterProxyModel()
         self.proxy.setSourceModel(self.transactions_model)
@@ -1143,6 +1680,7 @@ class TransactionsPage(QWidget):
         totals_layout.addStretch()
         main_layout.addLayout(totals_layout)
 
+        self._filter_timer = _debounce_timer(self, self._apply_filters_now)
         self.type_filter.currentIndexChanged.connect(self.on_filter_changed)
         self.status_filter.currentIndexChanged.connect(self.on_filter_changed)
         self.attachment_filter.currentIndexChanged.connect(self.on_filter_changed)
@@ -1154,43 +1692,44 @@ class TransactionsPage(QWidget):
         self.transactions_table.doubleClicked.connect(self.on_transaction_double_clicked)
         self.delete_selected_btn.clicked.connect(self.on_delete_selected_clicked)
 
-        # Initial load from backend for this page
-        txs = self.service.get_transactions()
-        self.transactions_model.set_transactions(txs)
-        self.periods_model.set_transactions(txs)
-
         self.refresh_totals()
 
     def on_filter_changed(self, *args, **kwargs):
-        from PyQt6.QtCore import QDate
+        self._filter_timer.start()
+
+    def _apply_filters_now(self):
+        self._filter_timer.stop()  # may be called directly, e.g. on reset
 
-        t = self.type_filter.currentText()
-        self.proxy.set_type_filter("income" if t == "Incomes" else "outgoing" if t == "Outgoings" else "all")
+        with self.proxy.batch_filter_changes():
+            t = self.type_filter.currentText()
+            self.proxy.set_type_filter("income" if t == "Incomes" else "outgoing" if t == "Outgoings" else "all")
 
-        s = self.status_filter.currentText()
-        self.proxy.set_status_filter("certain" if s == "Certain" else "pending" if s == "Pending" else "all")
+            s = self.status_filter.currentText()
+            self.proxy.set_status_filter("certain" if s == "Certain" else "pending" if s == "Pending" else "all")
 
-        a = self.attachment_filter.currentText()
-        self.proxy.set_attachment_filter("attached" if a == "Attached" else "unattached" if a == "Unattached" else "all")
+            a = self.attachment_filter.currentText()
+            self.proxy.set_attachment_filter("attached" if a == "Attached" else "unattached" if a == "Unattached" else "all")
 
-        df: QDate = self.date_from.date()
-        dt: QDate = self.date_to.date()
-        self.proxy.set_date_from(None if df.isNull() else date(df.year(), df.month(), df.day()))
-        self.proxy.set_date_to(None if dt.isNull() else date(dt.year(), dt.month(), dt.day()))
+            df: QDate = self.date_from.date()
+            dt: QDate = self.date_to.date()
+            self.proxy.set_date_from(None if df.isNull() else date(df.year(), df.month(), df.day()))
+            self.proxy.set_date_to(None if dt.isNull() else date(dt.year(), dt.month(), dt.day()))
 
-        self.proxy.set_search_text(self.search_edit.text())
+            self.proxy.set_search_text(self.search_edit.text())
         self.refresh_totals()
 
     def on_reset_filters_clicked(self):
-        from PyQt6.QtCore import QDate
-
-        self.type_filter.setCurrentIndex(0)
-        self.status_filter.setCurrentIndex(0)
-        self.attachment_filter.setCurrentIndex(0)
-        self.date_from.setDate(QDate())
-        self.date_to.setDate(QDate())
-        self.search_edit.clear()
-        self.on_filter_changed()
+        # Reset the widgets silently and apply the filters once at the end
+        with QSignalBlocker(self.type_filter), QSignalBlocker(self.status_filter), \
+                QSignalBlocker(self.attachment_filter), QSignalBlocker(self.date_from), \
+                QSignalBlocker(self.date_to), QSignalBlocker(self.search_edit):
+            self.type_filter.setCurrentIndex(0)
+            self.status_filter.setCurrentIndex(0)
+            self.attachment_filter.setCurrentIndex(0)
+            self.date_from.setDate(QDate())
+            self.date_to.setDate(QDate())
+            self.search_edit.clear()
+        self._apply_filters_now()
 
     def on_transaction_double_clicked(self, index):
         proxy_index = index
@@ -1207,10 +1746,10 @@ class TransactionsPage(QWidget):
         )
         if dialog.exec():
             data = dialog.get_transaction_data()
+            old = replace(tx)  # snapshot before the backend edits tx in place
             self.service.update_tx(data, tx)
-            txs = self.service.get_transactions()
-            self.transactions_model.set_transactions(txs)
-            self.periods_model.set_transactions(txs)  # for totals
+            self.transactions_model.update_transaction(old, tx)
+            self.changes_applied.emit()
 
         self.refresh_totals()
 
@@ -1230,10 +1769,9 @@ class TransactionsPage(QWidget):
             return
 
         self.service.delete_tx(selected_ids)
-        txs = self.service.get_transactions()
-        self.transactions_model.set_transactions(txs)
-        self.periods_model.set_transactions(txs)  # keep totals consistent
+        self.transactions_model.remove_transactions(selected_ids)
         self.refresh_totals()
+        self.changes_applied.emit()
 
     def refresh_totals(self):
         count, inc, out = self.proxy.visible_totals()
@@ -1252,6 +1790,8 @@ class PendingTransactionsPage(QWidget):
     All actions are delegated to backend via comments.
     """
 
+    changes_applied = pyqtSignal()
+
     def __init__(
         self,
         transactions_model: TransactionTableModel,
@@ -1263,22 +1803,21 @@ class PendingTransactionsPage(QWidget):
         self.transactions_model = transactions_model
         self.service = service
 
-        from PyQt6.QtCore import QDate
-
         main_layout = QVBoxLayout(self)
 
         self.tabs = QTabWidget()
         main_layout.addWidget(self.tabs)
 
+        # Fixed filters go in before the source, so the first mapping is the only one
         self.income_proxy = TransactionsFilterProxyModel()
-        self.income_proxy.setSourceModel(self.transactions_model)
         self.income_proxy.set_type_filter("income")
         self.income_proxy.set_status_filter("pending")
+        self.income_proxy.setSourceModel(self.transactions_model)
 
         self.outgoing_proxy = TransactionsFilterProxyModel()
-        self.outgoing_proxy.setSourceModel(self.transactions_model)
         self.outgoing_proxy.set_type_filter("outgoing")
         self.outgoing_proxy.set_status_filter("pending")
+        self.outgoing_proxy.setSourceModel(self.transactions_model)
 
         # ---------------- Incomes tab ----------------
         self.income_tab = QWidget()
@@ -1309,6 +1848,7 @@ class PendingTransactionsPage(QWidget):
         self.pending_income_table = QTableView()
         self.pending_income_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.pending_income_table.setAlternatingRowColors(True)
+        _use_fixed_row_heights(self.pending_income_table)
         self.pending_income_table.setModel(self.income_proxy)
         income_layout.addWidget(self.pending_income_table)
 
@@ -1351,6 +1891,7 @@ class PendingTransactionsPage(QWidget):
         self.pending_outgoing_table = QTableView()
         self.pending_outgoing_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.pending_outgoing_table.setAlternatingRowColors(True)
+        _use_fixed_row_heights(self.pending_outgoing_table)
         self.pending_outgoing_table.setModel(self.outgoing_proxy)
         outgoing_layout.addWidget(self.pending_outgoing_table)
 
@@ -1371,6 +1912,8 @@ class PendingTransactionsPage(QWidget):
         self.outgoing_date_to.setDate(QDate())
 
         # Filters
+        self._income_filter_timer = _debounce_timer(self, self._apply_income_filters)
+        self._outgoing_filter_timer = _debounce_timer(self, self._apply_outgoing_filters)
         self.income_date_from.dateChanged.connect(self.on_income_filter_changed)
         self.income_date_to.dateChanged.connect(self.on_income_filter_changed)
         self.income_attachment_filter.currentIndexChanged.connect(self.on_income_filter_changed)
@@ -1388,30 +1931,25 @@ class PendingTransactionsPage(QWidget):
         self.outgoing_mark_certain_btn.clicked.connect(self.on_outgoing_mark_certain_clicked)
         self.outgoing_delete_btn.clicked.connect(self.on_outgoing_delete_clicked)
 
-        # Initial load from backend for this page
-        txs = self.service.get_transactions()
-        self.transactions_model.set_transactions(txs)
-
     # --------- income tab ---------
 
     def _apply_income_filters(self):
-        from PyQt6.QtCore import QDate
-
         df: QDate = self.income_date_from.date()
         dt: QDate = self.income_date_to.date()
 
-        self.income_proxy.set_date_from(None if df.isNull() else date(df.year(), df.month(), df.day()))
-        self.income_proxy.set_date_to(None if dt.isNull() else date(dt.year(), dt.month(), dt.day()))
+        with self.income_proxy.batch_filter_changes():
+            self.income_proxy.set_date_from(None if df.isNull() else date(df.year(), df.month(), df.day()))
+            self.income_proxy.set_date_to(None if dt.isNull() else date(dt.year(), dt.month(), dt.day()))
 
-        a = self.income_attachment_filter.currentText()
-        self.income_proxy.set_attachment_filter(
-            "attached" if a == "Attached" else "unattached" if a == "Unattached" else "all"
-        )
+            a = self.income_attachment_filter.currentText()
+            self.income_proxy.set_attachment_filter(
+                "attached" if a == "Attached" else "unattached" if a == "Unattached" else "all"
+            )
 
-        self.income_proxy.set_search_text(self.income_search_edit.text())
+            self.income_proxy.set_search_text(self.income_search_edit.text())
 
     def on_income_filter_changed(self, *args, **kwargs):
-        self._apply_income_filters()
+        self._income_filter_timer.start()
 
     def _get_selected_pending(self, proxy: TransactionsFilterProxyModel, table: QTableView) -> List[Transaction]:
         idxs = table.selectionModel().selectedRows()
@@ -1423,54 +1961,58 @@ class PendingTransactionsPage(QWidget):
                 selected.append(tx)
         return selected
 
+    def _mark_certain(self, selected: List[Transaction]):
+        olds = [replace(tx) for tx in selected]
+        self.service.mark_certain([tx.id for tx in selected])
+        for old, tx in zip(olds, selected):
+            self.transactions_model.update_transaction(old, tx)
+        self.changes_applied.emit()
+
+    def _delete(self, selected: List[Transaction]):
+        ids = [tx.id for tx in selected]
+        self.service.delete_pending(ids)
+        self.transactions_model.remove_transactions(ids)
+        self.changes_applied.emit()
+
     def on_income_mark_certain_clicked(self):
         selected = self._get_selected_pending(self.income_proxy, self.pending_income_table)
-        self.service.mark_certain(selected)
-        txs = self.service.get_transactions()
-        self.transactions_model.set_transactions(txs)
+        self._mark_certain(selected)
 
     def on_income_delete_clicked(self):
         selected = self._get_selected_pending(self.income_proxy, self.pending_income_table)
         if not selected:
             return
-        self.service.delete_pending(selected)
-        txs = self.service.get_transactions()
-        self.transactions_model.set_transactions(txs)
+        self._delete(selected)
 
     # --------- outgoing tab ---------
 
     def _apply_outgoing_filters(self):
-        from PyQt6.QtCore import QDate
-
         df: QDate = self.outgoing_date_from.date()
         dt: QDate = self.outgoing_date_to.date()
 
-        self.outgoing_proxy.set_date_from(None if df.isNull() else date(df.year(), df.month(), df.day()))
-        self.outgoing_proxy.set_date_to(None if dt.isNull() else date(dt.year(), dt.month(), dt.day()))
+        with self.outgoing_proxy.batch_filter_changes():
+            self.outgoing_proxy.set_date_from(None if df.isNull() else date(df.year(), df.month(), df.day()))
+            self.outgoing_proxy.set_date_to(None if dt.isNull() else date(dt.year(), dt.month(), dt.day()))
 
-        a = self.outgoing_attachment_filter.currentText()
-        self.outgoing_proxy.set_attachment_filter(
-            "attached" if a == "Attached" else "unattached" if a == "Unattached" else "all"
-        )
+            a = self.outgoing_attachment_filter.currentText()
+            self.outgoing_proxy.set_attachment_filter(
+                "attached" if a == "Attached" else "unattached" if a == "Unattached" else "all"
+            )
 
-        self.outgoing_proxy.set_search_text(self.outgoing_search_edit.text())
+            self.outgoing_proxy.set_search_text(self.outgoing_search_edit.text())
 
     def on_outgoing_filter_changed(self, *args, **kwargs):
-        self._apply_outgoing_filters()
+        self._outgoing_filter_timer.start()
 
     def on_outgoing_mark_certain_clicked(self):
         selected = self._get_selected_pending(self.outgoing_proxy, self.pending_outgoing_table)
-        self.service.mark_certain(selected)
-        txs = self.service.get_transactions()
-        self.transactions_model.set_transactions(txs)
+        self._mark_certain(selected)
 
     def on_outgoing_delete_clicked(self):
         selected = self._get_selected_pending(self.outgoing_proxy, self.pending_outgoing_table)
         if not selected:
             return
-        self.service.delete_pending(selected)
-        txs = self.service.get_transactions()
-        self.transactions_model.set_transactions(txs)
+        self._delete(selected)
 
 
 # ---------------------------------------------------------------------------
@@ -1490,6 +2032,16 @@ class MainWindow(QMainWindow):
     def __init__(self, service: BudgetService):
         super().__init__()
         self.service = service
+        # service.version the models were last fully loaded at
+        self._loaded_version: Optional[int] = None
+
+        # Coalesce the backend's file writes; closeEvent() flushes what is left
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(SAVE_DEBOUNCE_MS)
+        self._save_timer.timeout.connect(self.service.flush)
+        self.service.save_scheduler = self._save_timer.start
+        self.service.on_write_error = self.on_save_failed
 
         self.setWindowTitle("Budget Tracker")
         self.resize(1200, 800)
@@ -1499,15 +2051,13 @@ class MainWindow(QMainWindow):
         self.transactions_model = TransactionTableModel()
 
         # period resolver so TransactionTableModel can show period names
-        def resolve_period(pid: Optional[int]) -> Optional[BudgetPeriod]:
-            if pid is None:
-                return None
-            for p in self.periods_model.periods:
-                if p.id == pid:
-                    return p
-            return None
-
-        self.transactions_model.set_period_resolver(resolve_period)
+        self.transactions_model.set_period_resolver(self.periods_model.get_by_id)
+        # Period totals follow the transactions model: a full reload rebuilds
+        # them once, incremental changes only touch the affected periods
+        self.transactions_model.modelReset.connect(
+            lambda: self.periods_model.set_transactions(self.transactions_model.transactions)
+        )
+        self.transactions_model.transactions_changed.connect(self.periods_model.apply_transaction_deltas)
 
         # Proxy for list of periods
         self.periods_proxy = BudgetPeriodFilterProxyModel()
@@ -1552,6 +2102,8 @@ class MainWindow(QMainWindow):
         self.pages.addWidget(self.budget_periods_page)
         self.pages.addWidget(self.transactions_page)
         self.pages.addWidget(self.pending_page)
+        for page in (self.budget_periods_page, self.transactions_page, self.pending_page):
+            page.changes_applied.connect(self.on_page_changes_applied)
 
         central_layout.addWidget(self.pages)
 
@@ -1584,7 +2136,6 @@ class MainWindow(QMainWindow):
         Backend should call this to push current data into the UI models.
         """
         self.periods_model.set_periods(periods)
-        self.periods_model.set_transactions(transactions)
         self.transactions_model.set_transactions(transactions)
 
     def refresh_from_backend(self):
@@ -1594,12 +2145,20 @@ class MainWindow(QMainWindow):
           - On app start
           - Whenever navbar page changes
           - From toolbar actions
+
+        Does nothing if the backend has not been written to since the
+        last reload.
         """
+        if self.service.version == self._loaded_version:
+            return
         # >>> RELOAD ALL MODELS FROM BACKEND HERE <<<
-        periods = self.service.get_periods()
-        txs = self.service.get_transactions()
+        periods, txs = self.service.get_snapshot()
         self.load_data(periods, txs)
+        self._loaded_version = self.service.version
+        self.refresh_page_summaries()
 
+    def refresh_page_summaries(self):
+        """Recompute the page-level summaries after the models changed."""
         # >>> PAGE-SPECIFIC AFTER-REFRESH UPDATES HERE <<<
         # Transactions page totals (uses proxy on transactions_model)
         self.transactions_page.refresh_totals()
@@ -1608,6 +2167,54 @@ class MainWindow(QMainWindow):
         period = self.budget_periods_page._get_selected_period()
         self.budget_periods_page._update_summary_labels(period)
 
+    def on_page_changes_applied(self):
+        """
+        Slot for every page's `changes_applied` signal, which a page emits
+        after writing to the backend and applying the change to the shared
+        models itself. Count the models as up to date so switching pages
+        doesn't reload them, and refresh the summaries the other pages show.
+        """
+        self._loaded_version = self.service.version
+        self.refresh_page_summaries()
+
+    def on_save_failed(self, exc: BaseException):
+        # The service keeps the changes and writes them again on the next save
+        QMessageBox.warning(
+            self,
+            "Saving failed",
+            f"Your changes could not be saved:\n{exc}\n\nThey will be saved again with the next change.",
+        )
+
+    def closeEvent(self, event):
+        self._save_timer.stop()
+        # There is no next change to retry on, so failures are handled here
+        errors: list[BaseException] = []
+        self.service.on_write_error = errors.append
+        try:
+            while True:
+                errors.clear()
+                self.service.flush(fsync=True)
+                if self.service.wait_for_writes():
+                    break
+                answer = QMessageBox.warning(
+                    self,
+                    "Saving failed",
+                    f"Your changes could not be saved:\n{errors[-1]}\n\n"
+                    "Retry, discard the unsaved changes and close, or cancel to keep the window open.",
+                    QMessageBox.StandardButton.Retry
+                    | QMessageBox.StandardButton.Discard
+                    | QMessageBox.StandardButton.Cancel,
+                    QMessageBox.StandardButton.Retry,
+                )
+                if answer == QMessageBox.StandardButton.Discard:
+                    break
+                if answer != QMessageBox.StandardButton.Retry:
+                    event.ignore()
+                    return
+        finally:
+            self.service.on_write_error = self.on_save_failed
+        super().closeEvent(event)
+
     # --------- navigation handler ---------
 
     def on_nav_page_changed(self, row: int):
@@ -1622,9 +2229,10 @@ class MainWindow(QMainWindow):
         dialog = PeriodDialog(self)
         if dialog.exec():
             data = dialog.get_period_data()
-            self.service.create_period(data)
-            # After creation, refresh everything
-            self.refresh_from_backend()
+            period = self.service.create_period(data)
+            # Insert just the new row; the page re-reads the links of the
+            # transactions it may have picked up
+            self.budget_periods_page._period_updated(period)
 
     def on_new_transaction_action_triggered(self):
         dialog = TransactionDialog(
@@ -1635,17 +2243,24 @@ class MainWindow(QMainWindow):
         )
         if dialog.exec():
             data = dialog.get_transaction_data()
-            self.service.create_tx(data)
-            # After creation, refresh everything
-            self.refresh_from_backend()
+            tx = self.service.create_tx(data)
+            # Only the new row and its period's totals need updating
+            self.transactions_model.add_transaction(tx)
+            self.on_page_changes_applied()
 
 
 # ---------------------------------------------------------------------------
 # Entry point (pure UI, no backend)
 # ---------------------------------------------------------------------------
 
-def main(service: BudgetService):
+def main(service: BudgetService, on_ready: Optional[Callable[[], None]] = None):
+    """
+    Build and run the UI. `on_ready` (e.g. closing a splash screen) is called
+    from the event loop once the main window has been shown.
+    """
     app = QApplication(sys.argv)
     window = MainWindow(service)
     window.show()
+    if on_ready is not None:
+        QTimer.singleShot(0, on_ready)
     sys.exit(app.exec())
@@ -2,7 +2,10 @@ from dataclasses import dataclass
 from datetime import date
 from typing import Optional, List, Callable
 
-@dataclass
+# Records are entities identified by their id: they compare and hash by
+# identity (eq=False), and stay mutable because the UI models share the
+# instances the service edits in place.
+@dataclass(slots=True, eq=False)
 class BudgetPeriod:
     id: int
     name: str 
@@ -10,7 +13,7 @@ class BudgetPeriod:
     end_date: date
     notes: str = ""
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Transaction:
     id: int
     type: str         
@@ -1,74 +1,343 @@
-from dataclasses import asdict
+from bisect import bisect_left, bisect_right
+import heapq
 import json
-import random
+import logging
+import mmap
+import os
+import pickle
+from concurrent.futures import Future, ThreadPoolExecutor
 from domain import BudgetPeriod, Transaction
 from datetime import date
+from itertools import chain
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+
+# Default data file locations (relative to the working directory)
+PERIODS_PATH = Path("Periods.json")
+TRANSACTIONS_PATH = Path("Transactions.json")
+# Single-transaction changes are appended here (next to the transactions
+# file) and folded into it once this many records have piled up
+JOURNAL_COMPACT_AT = 1000
+# Below this size a plain read() is cheaper than setting up a memory map
+MMAP_MIN_BYTES = 1 << 20
+
+# Every data file write goes through this one thread, so writes never block
+# the caller and two writes to the same file can never interleave
+_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="budget-save")
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+try:
+    import ijson
+except ModuleNotFoundError:
+    ijson = None
+
+
+# ---------- helpers for (de)serialization ----------
+
+def _loads(raw):
+    """Parse JSON bytes (or any buffer), using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(bytes(raw))
+
+
+def _read_json(filename: str | Path):
+    """
+    Parse a JSON file. Large files are parsed by orjson straight from a
+    read-only memory map, saving the copy into a bytes object.
+    A missing file reads as an empty list; it is created on the first save.
+    """
+    try:
+        f = open(filename, "rb")
+    except FileNotFoundError:
+        return []
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return []
+        # the stdlib parser needs bytes anyway, so a map would only add a copy
+        if orjson is None or size < MMAP_MIN_BYTES:
+            return _loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return _loads(view)
+
+
+def _json_default(obj):
+    """Stdlib json fallback for the types orjson serializes natively."""
+    # The records are flat, so spell the dicts out rather than going
+    # through dataclasses.fields() for every record
+    if isinstance(obj, Transaction):
+        return {
+            "id": obj.id,
+            "type": obj.type,
+            "date": obj.date.isoformat(),
+            "status": obj.status,
+            "description": obj.description,
+            "amount": obj.amount,
+            "category": obj.category,
+            "linked_period_id": obj.linked_period_id,
+        }
+    if isinstance(obj, BudgetPeriod):
+        return {
+            "id": obj.id,
+            "name": obj.name,
+            "start_date": obj.start_date.isoformat(),
+            "end_date": obj.end_date.isoformat(),
+            "notes": obj.notes,
+        }
+    if isinstance(obj, date):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(data) -> bytes:
+    """
+    Serialize to indented UTF-8 JSON bytes, using orjson when it is installed.
+    Dataclasses and dates are written directly, dates as ISO strings.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS)
+    return json.dumps(data, indent=2, ensure_ascii=False, default=_json_default).encode("utf-8")
+
+
+def _dumps_line(data) -> bytes:
+    """Serialize to a single line of UTF-8 JSON, newline included."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(data, ensure_ascii=False, default=_json_default).encode("utf-8") + b"\n"
+
+
+def _write_atomic(filename: str | Path, data: bytes, fsync: bool = False) -> None:
+    """
+    Write `data` to a temporary file next to `filename` and swap it in with
+    os.replace(), so a crash mid-write never leaves a truncated file. With
+    fsync the bytes are on disk before the swap.
+    """
+    target = Path(filename)
+    tmp = target.with_name(target.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp, target)
+
+
+_T = TypeVar("_T")
+
+
+def load_cached(loader: Callable[[Path], _T], filename: str | Path) -> _T:
+    """
+    Return loader(filename), reusing a pickle sidecar next to the JSON file
+    (e.g. Periods.pkl) when it is newer than the file. On a miss the JSON
+    file is parsed and the sidecar rewritten.
+    """
+    src = Path(filename)
+    cache = src.with_suffix(".pkl")
+    try:
+        src_mtime = src.stat().st_mtime_ns
+    except FileNotFoundError:
+        # nothing saved yet, so nothing worth caching
+        return loader(src)
+    try:
+        if cache.stat().st_mtime_ns > src_mtime:
+            return pickle.loads(cache.read_bytes())
+    except Exception:
+        # missing, stale or unreadable cache: fall back to the JSON file
+        pass
+
+    result = loader(src)
+    try:
+        cache.write_bytes(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass
+    return result
 
 
-# ---------- helpers for date handling ----------
+# ---------- record builders ----------
+# The stored dates are ISO strings; only the known date fields are converted.
 
-def _encode_dates(d: dict) -> dict:
-    """Convert any datetime.date values in a dict to ISO strings."""
-    for k, v in d.items():
-        if isinstance(v, date):
-            d[k] = v.isoformat()
-    return d
+# Arguments are passed positionally, which skips building a kwargs dict
+# for every record.
 
+def _period_from_dict(d: dict) -> BudgetPeriod:
+    return BudgetPeriod(
+        d["id"],
+        d["name"],
+        date.fromisoformat(d["start_date"]),
+        date.fromisoformat(d["end_date"]),
+        d.get("notes", ""),
+    )
 
-def _decode_dates(d: dict) -> dict:
-    """Convert ISO date strings in a dict back to datetime.date where possible."""
-    for k, v in d.items():
-        if isinstance(v, str):
-            try:
-                d[k] = date.fromisoformat(v)
-            except ValueError:
-                # not a date string, leave as-is
-                pass
-    return d
 
+def _tx_from_dict(d: dict) -> Transaction:
+    return Transaction(
+        d["id"],
+        d["type"],
+        date.fromisoformat(d["date"]),
+        d["status"],
+        d["description"],
+        d["amount"],
+        d.get("category", ""),
+        d.get("linked_period_id"),
+    )
 
-# ---------- periods ----------
 
-def save_periods_to_json(periods: list[BudgetPeriod], filename: str) -> None:
-    data = []
-    for p in periods:
-        d = asdict(p)
-        d = _encode_dates(d)  # handle any date fields in BudgetPeriod
-        data.append(d)
+# ---------- periods ----------
 
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+def save_periods_to_json(periods: list[BudgetPeriod], filename: str | Path, fsync: bool = False) -> None:
+    _write_atomic(filename, _dumps(periods), fsync)
 
 
-def load_periods_from_json(filename = "Periods.json") -> list[BudgetPeriod]:
-    with open(filename, "r", encoding="utf-8") as f:
-        data = json.load(f)  # json.load, not json.loads(f)
+def load_periods_from_json(filename: str | Path = PERIODS_PATH) -> list[BudgetPeriod]:
+    data = _read_json(filename)
 
-    return [BudgetPeriod(**_decode_dates(item)) for item in data]
+    return [_period_from_dict(item) for item in data]
 
 
 # ---------- transactions ----------
 
-def save_transactions_to_json(transactions: list[Transaction], filename: str) -> None:
-    data = []
-    for t in transactions:
-        d = asdict(t)
-        d = _encode_dates(d)  # handle any date fields in Transaction (e.g. "date")
-        data.append(d)
-
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
-
-
-def load_transactions_from_json(filename = "Transactions.json") -> list[Transaction]:
-    with open(filename, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    result: list[Transaction] = []
-    for item in data:
-        item = _decode_dates(item)  # convert date strings back to date objects
-        result.append(Transaction(**item))
-    return result
+def save_transactions_to_json(transactions: list[Transaction], filename: str | Path, fsync: bool = False) -> None:
+    _write_atomic(filename, _dumps(transactions), fsync)
+
+
+def load_transactions_from_json(filename: str | Path = TRANSACTIONS_PATH) -> list[Transaction]:
+    data = _read_json(filename)
+
+    return [_tx_from_dict(item) for item in data]
+
+
+def iter_transactions_from_json(filename: str | Path = TRANSACTIONS_PATH) -> Iterator[Transaction]:
+    """
+    Yield transactions one at a time. With ijson installed the file is
+    streamed, so the full list of raw dicts is never held in memory.
+    """
+    if ijson is None:
+        yield from load_transactions_from_json(filename)
+        return
+
+    try:
+        f = open(filename, "rb")
+    except FileNotFoundError:
+        return
+    with f:
+        # an empty file reads as no transactions, as in _read_json()
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        for item in ijson.items(f, "item", use_float=True):
+            yield _tx_from_dict(item)
+
+
+log = logging.getLogger(__name__)
+
+
+def _log_write_error(exc: BaseException) -> None:
+    log.error("saving the budget data failed", exc_info=exc)
+
+
+# ---------- transactions journal ----------
+#
+# One JSON object per line, either {"op": "put", "tx": {...}} (created or
+# changed) or {"op": "delete", "id": ...}. Before compaction swaps in the
+# new transactions file it appends the current state of every transaction
+# the journal file mentions. A journal left behind by a crash between the
+# swap and its removal therefore ends in exactly the state the new file
+# holds, and replaying it on top of that file changes nothing. Records that
+# never reached the file don't need this, so a compaction after a bulk
+# change writes at most a journal's worth of extra lines.
+
+def journal_path_for(filename: str | Path) -> Path:
+    """Journal that belongs to a transactions file, e.g. Transactions.jsonl."""
+    return Path(filename).with_suffix(".jsonl")
+
+
+def _journal_lines(records: list[dict]) -> bytes:
+    return b"".join(_dumps_line(r) for r in records)
+
+
+def append_journal(data: bytes, filename: str | Path, fsync: bool = False) -> None:
+    """Append already serialized journal lines (see _journal_lines)."""
+    with open(filename, "ab") as f:
+        f.write(data)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def replay_journal(transactions: list[Transaction], filename: str | Path) -> tuple[int, set[int]]:
+    """
+    Apply the journal records to `transactions` in place and return how
+    many were read and the ids of the transactions they mention, deleted
+    ones included.
+
+    Only a last line without its newline can come from a crash mid-append.
+    If it still parses it is kept and finished with the newline, otherwise
+    it is cut off, so later appends start on a fresh line. Any other line
+    that doesn't parse is corrupt: it is logged and skipped, and the file
+    is left as it is.
+    """
+    try:
+        f = open(filename, "r+b")
+    except FileNotFoundError:
+        return 0, set()
+
+    # id -> row of the live transaction; deleted rows are dropped by position,
+    # so a later put with the same id can't keep the deleted one alive
+    rows = {t.id: i for i, t in enumerate(transactions)}
+    dead: set[int] = set()
+    count = 0
+    ids: set[int] = set()
+    size = 0
+    with f:
+        for lineno, line in enumerate(f, 1):
+            size += len(line)
+            try:
+                record = _loads(line)
+            except ValueError:
+                if line.endswith(b"\n"):
+                    log.warning("skipping corrupt line %d in %s", lineno, filename)
+                else:
+                    f.truncate(size - len(line))
+                continue
+            if not line.endswith(b"\n"):
+                f.seek(0, os.SEEK_END)
+                f.write(b"\n")
+            count += 1
+            if record["op"] == "put":
+                tx = _tx_from_dict(record["tx"])
+                ids.add(tx.id)
+                row = rows.get(tx.id)
+                if row is None:
+                    rows[tx.id] = len(transactions)
+                    transactions.append(tx)
+                else:
+                    transactions[row] = tx
+            else:
+                ids.add(record["id"])
+                row = rows.pop(record["id"], None)
+                if row is not None:
+                    dead.add(row)
+
+    if dead:
+        transactions[:] = [t for row, t in enumerate(transactions) if row not in dead]
+    return count, ids
+
+
+def _replace_journaled(closing: bytes, data: bytes, filename: str | Path, fsync: bool = False) -> None:
+    """
+    Append the closing journal lines, swap in the serialized transactions
+    file and drop the journal it absorbed (see the notes on the journal above).
+    """
+    journal = journal_path_for(filename)
+    if closing:
+        append_journal(closing, journal, fsync)
+    _write_atomic(filename, data, fsync)
+    journal.unlink(missing_ok=True)
 
 
 # ---------- combined API ----------
@@ -76,84 +345,265 @@ def load_transactions_from_json(filename = "Transactions.json") -> list[Transact
 def Save(
     periods: list[BudgetPeriod],
     transactions: list[Transaction],
-    Pfilename: str = "Periods.json",
-    Tfilename: str = "Transactions.json",
+    Pfilename: str | Path = PERIODS_PATH,
+    Tfilename: str | Path = TRANSACTIONS_PATH,
 ) -> None:
     save_periods_to_json(periods, Pfilename)
     save_transactions_to_json(transactions, Tfilename)
 
 
+def load_all(
+    Pfilename: str | Path = PERIODS_PATH,
+    Tfilename: str | Path = TRANSACTIONS_PATH,
+) -> "BudgetService":
+    """Load both data files concurrently and return a ready BudgetService."""
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        periods_future = ex.submit(load_cached, load_periods_from_json, Pfilename)
+        txs_future = ex.submit(
+            load_cached,
+            lambda path: list(iter_transactions_from_json(path)),
+            Tfilename,
+        )
+        txs = txs_future.result()
+        journaled, journaled_ids = replay_journal(txs, journal_path_for(Tfilename))
+        return BudgetService(
+            periods_future.result(),
+            txs,
+            journaled=journaled,
+            journaled_ids=journaled_ids,
+            periods_path=Pfilename,
+            transactions_path=Tfilename,
+        )
+
+
 
 
 class BudgetService:
-    def __init__(self, periods: list[BudgetPeriod], txs: list[Transaction]):
+    def __init__(
+        self,
+        periods: list[BudgetPeriod],
+        txs: Iterable[Transaction],
+        journaled: Optional[int] = None,
+        journaled_ids: Iterable[int] = (),
+        periods_path: str | Path = PERIODS_PATH,
+        transactions_path: str | Path = TRANSACTIONS_PATH,
+    ):
         self.periods = periods
-        self.txs = txs
-    
-    def save_data(self):
-        Save(self.periods,self.txs)
+        self.txs = txs if isinstance(txs, list) else list(txs)
+        # Files flush() writes to (the ones load_all() read from)
+        self.periods_path = Path(periods_path)
+        self.transactions_path = Path(transactions_path)
+        # Next free ids. A new period gets a higher id than any period a
+        # transaction still links to, so orphaned transactions can't attach
+        # to it; a new transaction one higher than any id the journal file
+        # mentions (journaled_ids), so deleted ids are not handed out again.
+        self._next_period_id = max(
+            chain(
+                (p.id for p in self.periods),
+                (t.linked_period_id for t in self.txs if t.linked_period_id is not None),
+            ),
+            default=9999,
+        ) + 1
+        self._journaled_ids = set(journaled_ids)
+        self._next_tx_id = max(chain((t.id for t in self.txs), self._journaled_ids), default=9999) + 1
+        # id -> record, kept in step with the lists above
+        self._period_by_id = {p.id: p for p in self.periods}
+        self._tx_by_id = {t.id: t for t in self.txs}
+        self._index_periods()
+        # date -> transactions on that date, for the attachment sweep
+        self._txs_by_date: dict[date, list[Transaction]] = {}
+        for t in self.txs:
+            self._txs_by_date.setdefault(t.date, []).append(t)
+        # Bumped on every write so readers can tell whether their copy is stale
+        self.version = 0
+        # Which data files have changes that are not saved yet. Changes to
+        # transactions are queued as journal records; the transactions file
+        # itself is only rewritten when it doesn't hold the loaded list yet
+        # (journaled=None, i.e. the service was not built by load_all()).
+        self._periods_dirty = False
+        self._txs_dirty = journaled is None
+        self._journal_pending: list[dict] = []
+        # Records already in the journal file, and the transaction ids they
+        # mention (self._journaled_ids above)
+        self._journal_len = journaled or 0
+        # Called after a write instead of saving right away, so the caller
+        # can coalesce saves and call flush() later. Without one every
+        # write is saved immediately.
+        self.save_scheduler: Optional[Callable[[], None]] = None
+        # Told about every write that failed, once, on the thread that
+        # calls into the service. The data it held is marked unsaved again.
+        self.on_write_error: Callable[[BaseException], None] = _log_write_error
+        # Writes handed to the module's writer thread and not yet checked,
+        # with whether they wrote the periods file (else transactions).
+        # Data is serialized before it is handed over, the writer never
+        # reads the live lists.
+        self._writes: list[tuple[Future, bool]] = []
+
+    def _index_periods(self):
+        """Rebuild the periods-by-start_date index after the periods changed."""
+        self._periods_sorted = sorted(self.periods, key=lambda p: p.start_date)
+        self._period_starts = [p.start_date for p in self._periods_sorted]
+        self._index_period_ends(0)
+
+    def _index_period_ends(self, first: int):
+        """Recompute the running max of end_date over the index from `first` on."""
+        ends = self._period_end_max = self._period_end_max[:first] if first else []
+        latest = ends[-1] if ends else date.min
+        for p in self._periods_sorted[first:]:
+            if p.end_date > latest:
+                latest = p.end_date
+            ends.append(latest)
+
+    def _unindex_tx_date(self, tx: Transaction):
+        bucket = self._txs_by_date[tx.date]
+        bucket.remove(tx)
+        if not bucket:
+            del self._txs_by_date[tx.date]
+
+    def _mark_dirty(self, periods: bool = False):
+        self.version += 1
+        self._periods_dirty |= periods
+        if self.save_scheduler is None:
+            self.flush()
+        else:
+            self.save_scheduler()
+
+    def _journal_tx(self, *records: dict):
+        self._journal_pending.extend(records)
+        self._mark_dirty()
+
+    def _submit_write(self, periods: bool, fn: Callable, *args):
+        self._writes.append((_writer.submit(fn, *args), periods))
+        self._check_writes()
+
+    def _check_writes(self, wait: bool = False) -> bool:
+        """
+        Forget finished writes and report the failed ones; False if any
+        failed. What a failed write held is marked dirty again, so the next
+        flush() rewrites that file in full (transactions through compact()).
+        """
+        writes, self._writes = self._writes, []
+        failed = []
+        for future, periods in writes:
+            if not wait and not future.done():
+                self._writes.append((future, periods))
+                continue
+            exc = future.exception()
+            if exc is None:
+                continue
+            if periods:
+                self._periods_dirty = True
+            else:
+                self._txs_dirty = True
+            failed.append(exc)
+        for exc in failed:
+            self.on_write_error(exc)
+        return not failed
+
+    def wait_for_writes(self) -> bool:
+        """
+        Block until every submitted file write has finished and report the
+        failed ones. Returns whether all of them succeeded.
+        """
+        return self._check_writes(wait=True)
+
+    def flush(self, fsync: bool = False):
+        """
+        Start writing the data files that changed since the last flush.
+        The writes finish in the background, see wait_for_writes(). Pass
+        fsync=True (e.g. on shutdown) to have them reach the disk.
+        """
+        # files whose last write failed are written again
+        self._check_writes()
+        if self._periods_dirty:
+            self._periods_dirty = False
+            self._submit_write(True, _write_atomic, self.periods_path, _dumps(self.periods), fsync)
+        if self._txs_dirty or self._journal_len + len(self._journal_pending) > JOURNAL_COMPACT_AT:
+            self.compact(fsync)
+        elif self._journal_pending:
+            data = _journal_lines(self._journal_pending)
+            self._journal_len += len(self._journal_pending)
+            self._journaled_ids.update(
+                r["tx"].id if r["op"] == "put" else r["id"] for r in self._journal_pending
+            )
+            self._journal_pending.clear()
+            self._submit_write(False, append_journal, data, journal_path_for(self.transactions_path), fsync)
+
+    def compact(self, fsync: bool = False):
+        """Rewrite the transactions file and empty its journal (in the background)."""
+        # Pending records are only in memory, the new file covers them
+        closing = _journal_lines([
+            {"op": "put", "tx": self._tx_by_id[id]} if id in self._tx_by_id else {"op": "delete", "id": id}
+            for id in sorted(self._journaled_ids)
+        ])
+        self._journal_len = 0
+        self._journaled_ids.clear()
+        self._journal_pending.clear()
+        self._txs_dirty = False
+        self._submit_write(False, _replace_journaled, closing, _dumps(self.txs), self.transactions_path, fsync)
     
     #GETTERS    
     def get_periods(self) -> list[BudgetPeriod]:
         return self.periods
     def get_transactions(self) -> list[Transaction]:
         return self.txs
+    def get_snapshot(self) -> tuple[list[BudgetPeriod], list[Transaction]]:
+        return self.periods, self.txs
     
     #PERIOD CRUD
     def create_period(self, data : dict):
-        while True:
-            new_id = random.randint(10000,99999)
-            is_ok = True
-            for p in self.periods:
-                if p.id == new_id:
-                    is_ok = False
-                    break
-            if is_ok:
-                break
+        new_id = self._next_period_id
+        self._next_period_id += 1
         new_period = BudgetPeriod(new_id, data["name"], data["start_date"], data["end_date"], data["notes"])
         self.periods.append(new_period)
+        self._period_by_id[new_id] = new_period
+        i = bisect_right(self._period_starts, new_period.start_date)
+        self._periods_sorted.insert(i, new_period)
+        self._period_starts.insert(i, new_period.start_date)
+        self._index_period_ends(i)
         self.period_attachment_calculate(new_period)
-        self.save_data()
+        self._mark_dirty(periods=True)
+        return new_period
 
 
     def update_period(self, data: dict, period: BudgetPeriod):
-        u_period = next((p for p in self.periods if p.id == period.id), None)
-        index = self.periods.index(u_period)
+        u_period = self._period_by_id[period.id]
         u_period.name = data["name"]
         u_period.start_date = data["start_date"]
         u_period.end_date = data["end_date"]
         u_period.notes = data["notes"]
-        self.periods[index] = u_period
+        self._index_periods()
         self.period_attachment_calculate(u_period)
-        self.save_data()
+        self._mark_dirty(periods=True)
+        return u_period
 
 
     def delete_period(self, period: BudgetPeriod):
-        d_period = next((p for p in self.periods if p.id == period.id), None)
+        d_period = self._period_by_id.pop(period.id)
         self.periods.remove(d_period)
-        self.save_data()
+        self._index_periods()
+        self._mark_dirty(periods=True)
+        return d_period.id
 
 
     #TRANSACTIONS CRUD
     def create_tx(self, data: dict):
-        while True:
-            new_id = random.randint(10000,99999)
-            is_ok = True
-            for p in self.periods:
-                if p.id == new_id:
-                    is_ok = False
-                    break
-            if is_ok:
-                break
+        new_id = self._next_tx_id
+        self._next_tx_id += 1
         new_tx = Transaction(new_id, data["type"], data["date"], data["status"], data["description"], data["amount"], data["category"], data["linked_period_id"])
         new_tx = self.tx_attachment_checker(new_tx)
         self.txs.append(new_tx)
-        self.save_data()
+        self._tx_by_id[new_id] = new_tx
+        self._txs_by_date.setdefault(new_tx.date, []).append(new_tx)
+        self._journal_tx({"op": "put", "tx": new_tx})
+        return new_tx
 
 
     def update_tx(self, data: dict, tx: Transaction):
-        u_tx = next((t for t in self.txs if t.id == tx.id), None)
-        index = self.txs.index(u_tx)
+        u_tx = self._tx_by_id[tx.id]
+        if u_tx.date != data["date"]:
+            self._unindex_tx_date(u_tx)
+            self._txs_by_date.setdefault(data["date"], []).append(u_tx)
         u_tx.type = data["type"]
         u_tx.date = data["date"]
         u_tx.status = data["status"]
@@ -161,46 +611,62 @@ class BudgetService:
         u_tx.amount = data["amount"]
         u_tx.category = data["category"]
         u_tx.linked_period_id = data["linked_period_id"]
-        u_tx = self.tx_attachment_checker(u_tx)
-        self.txs[index] = u_tx
-        self.save_data()
+        self.tx_attachment_checker(u_tx)
+        self._journal_tx({"op": "put", "tx": u_tx})
 
 
     def delete_tx(self, ids: list[int]):
+        ids = set(ids)
         for id in ids:
-            d_tx = next((t for t in self.txs if t.id == id), None)
-            self.txs.remove(d_tx)
-        self.save_data()
+            d_tx = self._tx_by_id.pop(id)
+            self._unindex_tx_date(d_tx)
+        # filter in place, get_snapshot() hands this list out
+        self.txs[:] = [t for t in self.txs if t.id not in ids]
+        self._journal_tx(*({"op": "delete", "id": id} for id in ids))
 
     #PENDING TRANSACTION PROCESSES
-    def mark_certain(self, pendings: list[Transaction]):
-        for tx in pendings:
-            m_tx = next((t for t in self.txs if tx.id == t.id), None)
-            index = self.txs.index(m_tx)
-            m_tx.status = "certain"
-            self.txs[index] = m_tx
-        self.save_data()
+    def mark_certain(self, ids: list[int]):
+        marked = []
+        for id in set(ids):
+            tx = self._tx_by_id.get(id)
+            if tx is None:
+                continue
+            tx.status = "certain"
+            marked.append({"op": "put", "tx": tx})
+        self._journal_tx(*marked)
     
-    def delete_pending(self, pendings: list[Transaction]):
-        ids = []
-        for tx in pendings:
-            ids.append(tx.id)
+    def delete_pending(self, ids: list[int]):
         self.delete_tx(ids)
 
     #GENERAL ATTACHMENT CHECKER
     def recalculate_attachments(self):
-        new_txs = []
-        for tx in self.txs:
-            td = tx.date
-            for p in self.periods:
-                sd = p.start_date
-                ed = p.end_date
-                if sd < td and td < ed:
-                    tx.linked_period_id = p.id
-                    break
-            new_txs.append(tx)
-        self.txs = new_txs
-        self.save_data()
+        # The period only depends on the date, so sweep the distinct dates
+        # in order and link each date's transactions together. Periods that
+        # have started are kept in a heap ordered by their position in
+        # self.periods, so the first matching period in the list still wins;
+        # periods that have ended are dropped lazily once they reach the top.
+        by_date = self._txs_by_date
+        position = {p.id: i for i, p in enumerate(self.periods)}
+        by_start = self._periods_sorted
+        starts = self._period_starts
+        active: list[tuple[int, date, int]] = []  # (list position, end_date, id)
+        next_start = 0
+        relinked = []
+        for td in sorted(by_date):
+            # every period starting before td has started by now
+            started = bisect_left(starts, td, next_start)
+            for p in by_start[next_start:started]:
+                heapq.heappush(active, (position[p.id], p.end_date, p.id))
+            next_start = started
+            while active and active[0][1] <= td:
+                heapq.heappop(active)
+            if active:
+                pid = active[0][2]
+                for tx in by_date[td]:
+                    if tx.linked_period_id != pid:
+                        tx.linked_period_id = pid
+                        relinked.append({"op": "put", "tx": tx})
+        self._journal_tx(*relinked)
 
 
 
@@ -208,17 +674,30 @@ class BudgetService:
     def period_attachment_calculate(self, period: BudgetPeriod):
         sd = period.start_date
         ed = period.end_date
-        new_txs = []
+        relinked = []
         for tx in self.txs:
-            if sd < tx.date and tx.date < ed:
+            if sd < tx.date and tx.date < ed and tx.linked_period_id != period.id:
                 tx.linked_period_id = period.id
-            new_txs.append(tx)
-        self.txs = new_txs
-        self.save_data()
+                relinked.append({"op": "put", "tx": tx})
+        self._journal_tx(*relinked)
 
     def tx_attachment_checker(self, tx: Transaction) -> Transaction:
+        # Only periods starting before d can contain it. Walk those back from
+        # the latest start until no earlier period ends after d.
         d = tx.date
-        for p in self.periods:
-            if p.start_date < d and d < p.end_date:
-                tx.linked_period_id = p.id
+        by_start = self._periods_sorted
+        end_max = self._period_end_max
+        matches = []
+        i = bisect_left(self._period_starts, d) - 1
+        while i >= 0 and end_max[i] > d:
+            if d < by_start[i].end_date:
+                matches.append(by_start[i].id)
+            i -= 1
+        if len(matches) == 1:
+            tx.linked_period_id = matches[0]
+        elif matches:
+            # overlapping periods: the first one in the list wins, as in
+            # recalculate_attachments()
+            ids = set(matches)
+            tx.linked_period_id = next(p.id for p in self.periods if p.id in ids)
         return tx
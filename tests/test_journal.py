@@ -0,0 +1,53 @@
+import sys
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Code"))
+
+import service  # noqa: E402
+from domain import Transaction  # noqa: E402
+
+
+def _tx(id: int, description: str) -> Transaction:
+    return Transaction(id, "income", date(2024, 1, 2), "certain", description, 1.0)
+
+
+def _put(tx: Transaction) -> bytes:
+    return service._journal_lines([{"op": "put", "tx": tx}])
+
+
+class ReplayJournalTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.journal = Path(tmp.name) / "Transactions.jsonl"
+
+    def replay(self) -> list[str]:
+        txs = [_tx(1, "saved")]
+        service.replay_journal(txs, self.journal)
+        return [t.description for t in txs]
+
+    def test_complete_last_record_without_newline_survives_next_append(self):
+        self.journal.write_bytes(_put(_tx(2, "created")).rstrip(b"\n"))
+        self.assertEqual(self.replay(), ["saved", "created"])
+
+        service.append_journal(service._journal_lines([{"op": "delete", "id": 1}]), self.journal)
+        self.assertEqual(self.replay(), ["created"])
+
+    def test_torn_last_record_is_cut_off(self):
+        self.journal.write_bytes(_put(_tx(2, "created")) + _put(_tx(3, "torn"))[:20])
+        self.assertEqual(self.replay(), ["saved", "created"])
+        self.assertEqual(self.journal.read_bytes(), _put(_tx(2, "created")))
+
+    def test_corrupt_line_in_the_middle_is_skipped_and_kept(self):
+        data = _put(_tx(2, "before")) + b"not json\n" + _put(_tx(3, "after"))
+        self.journal.write_bytes(data)
+        with self.assertLogs(service.log, "WARNING"):
+            self.assertEqual(self.replay(), ["saved", "before", "after"])
+        self.assertEqual(self.journal.read_bytes(), data)
+
+
+if __name__ == "__main__":
+    unittest.main()